@@ -7,28 +7,38 @@ and splitting them into individual clip files using FFmpeg.
 """
 
 import argparse
+import asyncio
+import csv
+import functools
+import importlib.util
 import logging
+import os
+import queue
+import re
+import subprocess
 import sys
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fractions import Fraction
 from pathlib import Path
-from typing import List, Tuple, Union
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
-try:
-    from scenedetect import detect, AdaptiveDetector, split_video_ffmpeg
-    from scenedetect.video_manager import VideoManager
-    from scenedetect.scene_manager import SceneManager
-    from scenedetect.frame_timecode import FrameTimecode
+# OpenCV, NumPy, PySceneDetect, numba, PyAV and rich are imported inside the
+# functions that use them so that argument parsing (and --help or a bad path)
+# stays fast; here they are only needed for annotations.
+if TYPE_CHECKING:
     import cv2
-except ImportError as e:
-    print(f"Missing dependency: {e}")
-    print("Install with: pip install scenedetect[opencv] rich")
-    sys.exit(3)
-
-try:
-    from rich.console import Console
+    import numpy as np
     from rich.table import Table
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+
+INSTALL_HINT = "pip install scenedetect[opencv] rich"
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+AV_AVAILABLE = importlib.util.find_spec("av") is not None
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
 
 # Configure logging
 logging.basicConfig(
@@ -37,80 +47,573 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-__all__ = ['detect_scenes', 'split_video', 'detect_and_split']
+__all__ = ['SceneList', 'SceneSplitter', 'detect_scenes', 'split_video', 'detect_and_split', 'detect_and_split_many']
+
+# Scene-detection backends accepted by detect_scenes
+BACKENDS = ('ffmpeg', 'pyscenedetect', 'numba', 'pyav_hw')
+
+# Hardware decoders tried in order by the pyav_hw backend before software decode
+HWACCEL_DEVICES = ('cuda', 'vaapi', 'videotoolbox', 'd3d11va')
+
+# FFmpeg's scene score lies in [0, 1]; this maps the default adaptive ratio 2.0 to 0.3
+FFMPEG_SCENE_SCALE = 0.15
+
+# Downscaled luma plane used by the numba backend
+LUMA_WIDTH = 64
+LUMA_HEIGHT = 36
+
+# Below this many frames the numba backend decodes without a reader thread
+THREADED_DECODE_MIN_FRAMES = 300
+
+# Minimum mean absolute luma difference for a frame to count as a cut
+MIN_CONTENT_VAL = 15.0
+
+# Clips are written as fragmented MP4: the moov atom goes first and samples
+# follow in keyframe fragments, so finalising a clip needs no seek back or
+# rewrite pass (unlike +faststart, which rewrites the whole file).
+MP4_MOVFLAGS = "+frag_keyframe+empty_moov+default_base_moof"
+MP4_FRAG_DURATION = 1_000_000  # microseconds
+
+# FFmpeg output options for stream-copied and re-encoded clips
+_MP4_ARGS = ["-movflags", MP4_MOVFLAGS, "-frag_duration", str(MP4_FRAG_DURATION)]
+COPY_ARGS = ["-c", "copy", "-map", "0", "-avoid_negative_ts", "make_zero", *_MP4_ARGS]
+REENCODE_ARGS = [
+    "-map", "0:v:0", "-map", "0:a?",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "22",
+    "-c:a", "aac", "-sn",
+    *_MP4_ARGS
+]
+
+# Threads per FFmpeg/OpenCV decode in detect_and_split_many workers
+WORKER_THREADS = 2
+
+# FFmpeg thread and concurrent-process caps for this process; set in
+# detect_and_split_many workers so the pool as a whole stays within the CPU
+_ffmpeg_threads: Optional[int] = None
+_ffmpeg_max_procs: Optional[int] = None
+
+_PTS_TIME_RE = re.compile(r"pts_time:\s*([\d.]+)")
+_PROGRESS_RE = re.compile(r"^(\w+)=(\S*)$")
+_FPS_RE = re.compile(r"Stream #.*Video:.*?([\d.]+) fps")
+
+
+class SceneList(list):
+    """List of (start_sec, end_sec) scenes that also carries the source frame rate."""
+    
+    def __init__(self, scenes=(), fps: Optional[float] = None):
+        super().__init__(scenes)
+        self.fps = fps
+
+
+def _load_cv2() -> ModuleType:
+    """Import OpenCV, applying this process's thread cap if one is set."""
+    import cv2
+    if _ffmpeg_threads is not None:
+        cv2.setNumThreads(_ffmpeg_threads)
+    return cv2
+
+
+def _ffmpeg_thread_args() -> List[str]:
+    """
+    Return the ``-threads`` option for FFmpeg commands, if capped.
+    
+    Before ``-i`` it caps the decoder; repeat it after the input to cap
+    filters and encoders too.
+    """
+    if _ffmpeg_threads is None:
+        return []
+    return ["-threads", str(_ffmpeg_threads)]
 
 
 def detect_scenes(
     video_path: str,
     adaptive_threshold: float = 2.0,
     min_scene_len: int = 15,
-    window: int = 20
-) -> List[Tuple[float, float]]:
+    window: int = 20,
+    backend: str = "ffmpeg",
+    splitter: Optional["SceneSplitter"] = None
+) -> SceneList:
     """
-    Detect scene boundaries in a video using PySceneDetect's AdaptiveDetector.
+    Detect scene boundaries in a video.
+    
+    The default ``ffmpeg`` backend runs FFmpeg's ``select='gt(scene,T)'`` filter so
+    the scene metric is computed inside libavfilter and frames never enter Python.
+    ``adaptive_threshold`` is scaled by ``FFMPEG_SCENE_SCALE`` to obtain ``T``.
+    The ``pyscenedetect`` backend uses PySceneDetect's AdaptiveDetector, and the
+    ``numba`` backend runs the same adaptive rule as a JIT-compiled kernel over a
+    downscaled luma plane. ``pyav_hw`` feeds that kernel from PyAV with hardware
+    decoding (NVDEC/VAAPI/VideoToolbox), falling back to software decode.
     
     Args:
         video_path: Path to the input video file
         adaptive_threshold: Ratio threshold for scene detection (default: 2.0)
         min_scene_len: Minimum scene length in frames (default: 15)
-        window: Rolling average window size in frames (default: 20)
+        window: Rolling average window size in frames (default: 20); the
+            ffmpeg backend has no rolling window and ignores it
+        backend: Detection backend, one of ``BACKENDS`` (default: "ffmpeg")
+        splitter: SceneSplitter whose frame buffers the numba backends reuse
+            (default: one per thread, which keeps buffers only up to its
+            ``max_frames``)
     
     Returns:
-        List of tuples containing (start_sec, end_sec) for each scene
+        SceneList of (start_sec, end_sec) tuples for each scene, with the
+        video frame rate in its ``fps`` attribute
         
     Raises:
         FileNotFoundError: If video file doesn't exist
-        ValueError: If video file is invalid or corrupted
+        ValueError: If video file is invalid or corrupted, or backend is unknown
     """
     video_path = Path(video_path)
     if not video_path.exists():
         raise FileNotFoundError(f"Video file not found: {video_path}")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if backend in ("numba", "pyav_hw") and not NUMBA_AVAILABLE:
+        raise ValueError(f"The {backend} backend requires numba: pip install numba")
+    if backend == "pyav_hw" and not AV_AVAILABLE:
+        raise ValueError("The pyav_hw backend requires PyAV: pip install av")
     
     logger.info(f"Detecting scenes in {video_path}")
-    logger.debug(f"Parameters: threshold={adaptive_threshold}, min_len={min_scene_len}, window={window}")
+    logger.debug(f"Parameters: threshold={adaptive_threshold}, min_len={min_scene_len}, "
+                 f"window={window}, backend={backend}")
     
     try:
-        # Create adaptive detector with specified parameters
-        detector = AdaptiveDetector(
-            adaptive_threshold=adaptive_threshold,
-            min_scene_len=min_scene_len,
-            window=window
-        )
-        
-        # Detect scenes using PySceneDetect
-        scene_list = detect(
-            str(video_path),
-            detector,
-            show_progress=False  # We'll handle progress ourselves
-        )
-        
-        # Convert FrameTimecode objects to float seconds
-        scenes = []
-        for start, end in scene_list:
-            start_sec = start.get_seconds()
-            end_sec = end.get_seconds()
-            scenes.append((start_sec, end_sec))
+        if backend == "ffmpeg":
+            scenes, fps = _detect_scenes_ffmpeg(video_path, adaptive_threshold, min_scene_len)
+        elif backend in ("numba", "pyav_hw"):
+            try:
+                scenes, fps = _detect_scenes_numba(
+                    video_path, adaptive_threshold, min_scene_len, window,
+                    splitter or _local_splitter(),
+                    hwaccel=backend == "pyav_hw"
+                )
+            finally:
+                if splitter is None:
+                    # The implicit per-thread splitter must not pin a long video's buffers
+                    _local_splitter()._drop_oversized_buffers()
+        else:
+            scenes, fps = _detect_scenes_pyscenedetect(video_path, adaptive_threshold, min_scene_len, window)
         
         logger.info(f"Detected {len(scenes)} scenes")
-        return scenes
+        return SceneList(scenes, fps=fps)
         
+    except ImportError:
+        raise
     except Exception as e:
         logger.error(f"Error detecting scenes: {e}")
         raise ValueError(f"Failed to process video: {e}")
 
 
+def _detect_scenes_ffmpeg(
+    video_path: Path,
+    adaptive_threshold: float,
+    min_scene_len: int
+) -> Tuple[List[Tuple[float, float]], Optional[float]]:
+    """Detect scenes with a single FFmpeg scene-score probe; also returns fps."""
+    scene_threshold = min(adaptive_threshold * FFMPEG_SCENE_SCALE, 1.0)
+    # Scene frames go to showinfo; the other branch passes every frame to the
+    # null output so -progress reports where the last frame ends. The container
+    # Duration is not used, as some formats (e.g. MKV) count the start offset
+    # in it while pts_time is rebased to zero.
+    cmd = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-progress", "pipe:2",
+        *_ffmpeg_thread_args(),
+        "-i", str(video_path),
+        "-filter_complex",
+        f"[0:v:0]split[scene][all];[scene]select='gt(scene,{scene_threshold:.4f})',showinfo,nullsink;"
+        "[all]null[out]",
+        "-map", "[out]", "-f", "null", "-"
+    ]
+    logger.debug(f"Running: {' '.join(cmd)}")
+    
+    # Stream stderr line by line so memory stays flat on long videos; metadata
+    # tags need not be UTF-8, so undecodable bytes are replaced
+    duration = 0.0
+    fps = 0.0
+    cuts = []
+    tail = deque(maxlen=5)
+    with subprocess.Popen(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace"
+    ) as proc:
+        try:
+            for line in proc.stderr:
+                match = _PTS_TIME_RE.search(line)
+                if match:
+                    cuts.append(float(match.group(1)))
+                    continue
+                match = _PROGRESS_RE.match(line)
+                if match:
+                    key, value = match.groups()
+                    if key == "out_time_us" and value.isdigit():
+                        duration = int(value) / 1_000_000
+                    continue
+                if not fps:
+                    match = _FPS_RE.search(line)
+                    if match:
+                        fps = float(match.group(1))
+                        continue
+                tail.append(line)
+        except BaseException:
+            proc.kill()
+            raise
+        returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with code {returncode}: {''.join(tail).strip()}")
+    if not duration:
+        raise RuntimeError("Could not determine video duration")
+    
+    # Enforce the minimum scene length between consecutive cuts
+    min_gap = min_scene_len / (fps or 30)
+    boundaries = [0.0]
+    for cut in sorted(cuts):
+        if cut - boundaries[-1] >= min_gap and cut < duration:
+            boundaries.append(cut)
+    boundaries.append(duration)
+    
+    return list(zip(boundaries[:-1], boundaries[1:])), fps or None
+
+
+def _detect_scenes_pyscenedetect(
+    video_path: Path,
+    adaptive_threshold: float,
+    min_scene_len: int,
+    window: int
+) -> Tuple[List[Tuple[float, float]], Optional[float]]:
+    """Detect scenes with PySceneDetect's AdaptiveDetector; also returns fps."""
+    import numpy as np
+    from scenedetect import open_video, AdaptiveDetector, SceneManager
+    # PySceneDetect decodes with OpenCV
+    _load_cv2()
+    
+    # Create adaptive detector with specified parameters
+    detector = AdaptiveDetector(
+        adaptive_threshold=adaptive_threshold,
+        min_scene_len=min_scene_len,
+        window_width=window
+    )
+    
+    video = open_video(str(video_path))
+    scene_manager = SceneManager()
+    scene_manager.add_detector(detector)
+    
+    # Collect cut frame numbers as they are found instead of materialising a
+    # FrameTimecode scene list and converting each entry afterwards. Newer
+    # PySceneDetect releases pass a FrameTimecode rather than an int.
+    cuts = []
+    scene_manager.detect_scenes(
+        video,
+        callback=lambda _frame, cut: cuts.append(getattr(cut, "frame_num", cut))
+    )
+    
+    fps = float(video.frame_rate)
+    if not cuts:
+        # Matches scenedetect.detect(): no cuts means no scenes
+        return [], fps
+    
+    # Convert all boundaries to seconds in one step; the last scene ends one
+    # frame after the last decoded position
+    end_frame = video.position.frame_num + 1
+    bounds = np.concatenate([[0], np.unique(cuts), [end_frame]]) / fps
+    scenes = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+    
+    return scenes, fps
+
+
+def _detect_scenes_numba(
+    video_path: Path,
+    adaptive_threshold: float,
+    min_scene_len: int,
+    window: int,
+    splitter: "SceneSplitter",
+    hwaccel: bool = False
+) -> Tuple[List[Tuple[float, float]], float]:
+    """Detect scenes with the JIT-compiled adaptive kernel on downscaled luma; also returns fps."""
+    cv2 = _load_cv2()
+    adaptive_cuts = _adaptive_cuts_kernel()
+    luma = splitter._luma_buffer()
+    if hwaccel:
+        luma, n_frames, fps = _decode_luma_pyav(video_path, luma)
+    else:
+        cap = cv2.VideoCapture(str(video_path))
+        if not cap.isOpened():
+            raise RuntimeError(f"Could not open video: {video_path}")
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30
+        try:
+            luma, n_frames = _decode_luma(cap, luma)
+        finally:
+            cap.release()
+    # Keep a grown buffer for the next video
+    splitter.luma = luma
+    if n_frames == 0:
+        logger.warning(f"No frames decoded from {video_path}")
+        return [], fps
+    
+    diffs, csum, cuts = splitter._work_buffers(n_frames)
+    _make_frame_diffs(splitter.height, splitter.width)(luma[:n_frames], diffs)
+    n_cuts = adaptive_cuts(diffs, csum, cuts, int(window), float(adaptive_threshold), int(min_scene_len))
+    
+    boundaries = [0.0] + [cut / fps for cut in cuts[:n_cuts].tolist()] + [n_frames / fps]
+    return list(zip(boundaries[:-1], boundaries[1:])), fps
+
+
+def _decode_luma_pyav(video_path: Path, luma: "np.ndarray") -> Tuple["np.ndarray", int, float]:
+    """
+    Decode downscaled luma into ``luma`` with PyAV, preferring a hardware decoder.
+    
+    Each device in ``HWACCEL_DEVICES`` is tried in turn and software decode is
+    used if none of them works. Returns the luma buffer (a larger one if the
+    video did not fit), the number of frames decoded and the stream frame rate.
+    """
+    import av
+    import numpy as np
+    from av.codec.hwaccel import HWAccel
+    
+    for device in HWACCEL_DEVICES + (None,):
+        hwaccel = HWAccel(device_type=device, allow_software_fallback=False) if device else None
+        try:
+            # Metadata tags need not be UTF-8; don't fail the open on them
+            with av.open(str(video_path), hwaccel=hwaccel, metadata_errors="replace") as container:
+                stream = container.streams.video[0]
+                fps = float(stream.average_rate or 30)
+                if stream.frames > len(luma):
+                    luma = np.empty((stream.frames,) + luma.shape[1:], dtype=np.uint8)
+                height, width = luma.shape[1:]
+                n_frames = 0
+                for frame in container.decode(stream):
+                    luma = _grow_luma(luma, n_frames)
+                    luma[n_frames] = frame.reformat(
+                        width=width, height=height, format="gray"
+                    ).to_ndarray()
+                    n_frames += 1
+        except Exception as e:
+            if device is None:
+                raise
+            logger.debug(f"Hardware decode with {device} unavailable: {e}")
+            continue
+        logger.debug(f"Decoded {n_frames} frames with {device or 'software'} decoder")
+        return luma, n_frames, fps
+
+
+def _decode_luma(cap: "cv2.VideoCapture", luma: "np.ndarray") -> Tuple["np.ndarray", int]:
+    """
+    Decode all frames into the contiguous (N, height, width) uint8 buffer ``luma``.
+    
+    The buffer is replaced by a larger one up front if the container's frame
+    count does not fit, and every frame is written into its row through
+    OpenCV's ``dst`` parameters, so the loop allocates no per-frame arrays.
+    For longer videos frames are read on a background thread while this thread
+    converts and downscales the previous one. Returns the buffer and the
+    number of frames actually decoded.
+    """
+    import cv2
+    import numpy as np
+    
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    
+    if frame_count > len(luma):
+        luma = np.empty((frame_count,) + luma.shape[1:], dtype=np.uint8)
+    luma_size = (luma.shape[2], luma.shape[1])
+    gray = np.empty((height, width), dtype=np.uint8)
+    
+    if frame_count >= THREADED_DECODE_MIN_FRAMES:
+        frames = _read_frames_threaded(cap, width, height)
+    else:
+        frames = _read_frames(cap, width, height)
+    
+    n_frames = 0
+    for frame in frames:
+        luma = _grow_luma(luma, n_frames)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+        cv2.resize(gray, luma_size, dst=luma[n_frames], interpolation=cv2.INTER_AREA)
+        n_frames += 1
+    
+    return luma, n_frames
+
+
+def _grow_luma(luma: "np.ndarray", index: int) -> "np.ndarray":
+    """
+    Return ``luma`` if it has a row for frame ``index``, else a copy of it grown geometrically.
+    
+    Decoders write past the end only when the container reported too few frames.
+    """
+    if index < len(luma):
+        return luma
+    import numpy as np
+    extra = np.empty((max(len(luma), 1),) + luma.shape[1:], dtype=luma.dtype)
+    return np.concatenate([luma, extra])
+
+
+def _read_frames(cap: "cv2.VideoCapture", width: int, height: int) -> Iterator["np.ndarray"]:
+    """Yield decoded BGR frames, reusing a single frame buffer."""
+    import numpy as np
+    
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    while True:
+        ok, frame = cap.read(frame)
+        if not ok:
+            return
+        yield frame
+
+
+def _read_frames_threaded(cap: "cv2.VideoCapture", width: int, height: int) -> Iterator["np.ndarray"]:
+    """
+    Yield decoded BGR frames read ahead on a worker thread.
+    
+    Two preallocated slots are handed back and forth through queues: the reader
+    fills one (``cap.read`` releases the GIL) while the caller processes the
+    other, and a slot is only reused once the caller resumes the generator.
+    """
+    import numpy as np
+    
+    slots = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(2)]
+    free = queue.Queue()
+    ready = queue.Queue()
+    for i in range(len(slots)):
+        free.put(i)
+    
+    def read() -> None:
+        try:
+            while True:
+                i = free.get()
+                if i is None:
+                    return
+                ok, frame = cap.read(slots[i])
+                if not ok:
+                    return
+                slots[i] = frame
+                ready.put(i)
+        finally:
+            ready.put(None)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        reader = executor.submit(read)
+        try:
+            while True:
+                i = ready.get()
+                if i is None:
+                    break
+                yield slots[i]
+                free.put(i)
+        finally:
+            # Unblock the reader if the caller stops early
+            free.put(None)
+        reader.result()
+
+
+# numba kernels: written as plain functions and compiled on first use of the
+# numba backends by the lru_cache factories below, so the Python sources are
+# never rebound and concurrent first calls cannot re-jit a dispatcher.
+@functools.lru_cache(maxsize=None)
+def _adaptive_cuts_kernel():
+    """
+    Compile the adaptive cut kernel.
+    
+    Explicit signatures compile eagerly with no call-time type inference and,
+    with cache=True, are loaded from __pycache__ on later runs, keeping JIT
+    warm-up off the CLI path.
+    """
+    from numba import njit
+    return njit(
+        "i8(f8[::1], f8[::1], i8[::1], i8, f8, i8)", fastmath=True, cache=True
+    )(_adaptive_cuts)
+
+
+@functools.lru_cache(maxsize=8)
+def _make_frame_diffs(height: int, width: int):
+    """
+    Compile a frame-difference kernel specialised to (height, width) frames.
+    
+    The pixel count is a compile-time constant in the returned kernel, so LLVM
+    knows the trip count of the inner sum-of-absolute-differences loop and can
+    fully unroll it into packed byte SAD instructions (e.g. vpsadbw on AVX2).
+    The kernel writes the N mean absolute differences between consecutive
+    frames of an (N, height, width) uint8 buffer into ``diffs`` (the first is zero).
+    """
+    import numpy as np
+    from numba import njit
+    n_pixels = height * width
+    
+    @njit("void(u1[:, :, ::1], f8[::1])", fastmath=True, cache=True)
+    def frame_diffs(luma, diffs):
+        n = luma.shape[0]
+        if n > 0:
+            diffs[0] = 0.0
+        for k in range(1, n):
+            a = luma[k].reshape(-1)
+            b = luma[k - 1].reshape(-1)
+            acc = 0
+            for i in range(n_pixels):
+                acc += abs(np.int32(a[i]) - np.int32(b[i]))
+            diffs[k] = acc / n_pixels
+    
+    return frame_diffs
+
+
+def _adaptive_cuts(diffs, csum, cuts, window, thresh, min_len):
+    """
+    Write cut frame indices into ``cuts`` using PySceneDetect's adaptive rule.
+    
+    A frame is a cut when its difference to the previous frame exceeds
+    ``thresh`` times the mean difference of the ``window`` frames on either
+    side, is at least ``MIN_CONTENT_VAL``, and lies ``min_len`` frames past
+    the previous cut. Window sums come from a prefix sum written into ``csum``
+    (length N + 1), so the cost is O(N) regardless of ``window``. ``cuts``
+    needs room for N indices; returns the number of cuts written.
+    """
+    n = diffs.shape[0]
+    acc = 0.0
+    csum[0] = 0.0
+    for i in range(n):
+        acc += diffs[i]
+        csum[i + 1] = acc
+    
+    n_cuts = 0
+    last_cut = 0
+    for i in range(window + 1, n - window):
+        # Sum of diffs[i - window : i + window + 1] without diffs[i] itself
+        average = (csum[i + window + 1] - csum[i - window] - diffs[i]) / (2 * window)
+        if average > 1e-5:
+            ratio = diffs[i] / average
+        else:
+            ratio = 255.0
+        if ratio >= thresh and diffs[i] >= MIN_CONTENT_VAL and i - last_cut >= min_len:
+            cuts[n_cuts] = i
+            n_cuts += 1
+            last_cut = i
+    return n_cuts
+
+
 def split_video(
     video_path: str,
     scene_list: List[Tuple[float, float]],
-    output_dir: Union[str, Path] = "clips"
-) -> None:
+    output_dir: Union[str, Path] = "clips",
+    copy: bool = True,
+    fps: Optional[float] = None
+) -> List[Path]:
     """
     Split a video into individual clip files based on scene boundaries.
     
+    By default clips are stream-copied, so cuts snap to the nearest keyframe.
+    Contiguous scene lists (as returned by detect_scenes) are split by a single
+    FFmpeg segment-muxer pass that reads the input once; other lists get one
+    fast-seeking ``-c copy`` FFmpeg per clip, run concurrently. Pass
+    ``copy=False`` when frame-accurate cuts matter; each scene is then
+    re-encoded by its own FFmpeg, also run concurrently.
+    
     Args:
         video_path: Path to the input video file
         scene_list: List of (start_sec, end_sec) tuples for scene boundaries
         output_dir: Directory to save output clips (default: "clips")
+        copy: Stream-copy keyframe-aligned clips in one pass (default: True)
+        fps: Video frame rate for ``copy=False``; defaults to ``scene_list.fps``
+            when given a SceneList, otherwise it is read with ffprobe
+        
+    Returns:
+        List of created clip paths (scene_001.mp4, scene_002.mp4, ...). With
+        stream copy, scenes shorter than the keyframe interval can be merged,
+        so there may be fewer clips than scenes
         
     Raises:
         FileNotFoundError: If video file doesn't exist
@@ -129,34 +632,191 @@ def split_video(
     logger.info(f"Splitting video into {len(scene_list)} clips")
     logger.info(f"Output directory: {output_dir}")
     
+    # Per-clip paths write exactly these names; the segment muxer reports its own
+    clip_paths = [output_dir / f"scene_{i:03d}.mp4" for i in range(1, len(scene_list) + 1)]
+    if not clip_paths:
+        return clip_paths
+    
     try:
-        # Get FPS once via OpenCV
-        cap = cv2.VideoCapture(str(video_path))
-        fps = cap.get(cv2.CAP_PROP_FPS) or 30
-        cap.release()
-        
-        # Convert seconds → FrameTimecode tuples
-        scenes_ftc = [
-            (FrameTimecode(start_sec, fps=fps),
-             FrameTimecode(end_sec, fps=fps))
-            for start_sec, end_sec in scene_list
-        ]
-        
-        # Split video using FFmpeg
-        split_video_ffmpeg(
-            str(video_path),
-            scenes_ftc,
-            str(output_dir),
-            suppress_output=True
-        )
+        if copy and _is_contiguous(scene_list):
+            clip_paths = _split_video_segments(video_path, scene_list, output_dir)
+            if len(clip_paths) != len(scene_list):
+                # Cuts inside one GOP collapse onto the same keyframe
+                logger.warning(f"Keyframe-aligned split produced {len(clip_paths)} clips "
+                               f"for {len(scene_list)} scenes; use copy=False for exact cuts")
+        elif copy:
+            _run_blocking(_split_all(video_path, scene_list, clip_paths, COPY_ARGS))
+        else:
+            if fps is None:
+                fps = getattr(scene_list, "fps", None) or _probe_fps(video_path)
+            _split_video_reencode(video_path, scene_list, clip_paths, fps)
         
         logger.info("Video splitting completed successfully")
+        return clip_paths
         
     except Exception as e:
         logger.error(f"Error splitting video: {e}")
         raise RuntimeError(f"Failed to split video: {e}")
 
 
+def _split_video_segments(
+    video_path: Path,
+    scene_list: List[Tuple[float, float]],
+    output_dir: Path
+) -> List[Path]:
+    """Split with one stream-copy pass of FFmpeg's segment muxer; returns the clips written."""
+    cmd = [
+        "ffmpeg", "-nostdin", "-y", "-v", "error",
+        *_ffmpeg_thread_args(),
+        "-i", str(video_path),
+    ]
+    if len(scene_list) == 1:
+        # No cut points: without -segment_times the segment muxer would fall
+        # back to its default 2 s segment_time, so copy the whole video instead
+        clip_path = output_dir / "scene_001.mp4"
+        cmd += [*COPY_ARGS, str(clip_path)]
+        _run_ffmpeg(cmd)
+        return [clip_path]
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The muxer lists the segments it actually wrote, which can be fewer
+        # than requested when several cut points snap to the same keyframe
+        segment_list = Path(tmp_dir) / "segments.csv"
+        
+        # Every scene end except the last is a cut point
+        segment_times = ",".join(f"{end:.3f}" for _, end in scene_list[:-1])
+        cmd += [
+            "-c", "copy", "-map", "0",
+            "-f", "segment",
+            "-segment_format", "mp4",
+            "-segment_format_options", f"movflags={MP4_MOVFLAGS}:frag_duration={MP4_FRAG_DURATION}",
+            "-segment_times", segment_times,
+            "-reset_timestamps", "1",
+            "-segment_start_number", "1",
+            "-segment_list", str(segment_list),
+            "-segment_list_type", "csv",
+            str(output_dir / "scene_%03d.mp4")
+        ]
+        _run_ffmpeg(cmd)
+        
+        with open(segment_list, newline='', encoding='utf-8') as f:
+            return [output_dir / row[0] for row in csv.reader(f) if row]
+
+
+def _run_ffmpeg(cmd: List[str]) -> None:
+    """Run an FFmpeg command, raising RuntimeError with its stderr on failure."""
+    logger.debug(f"Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with code {result.returncode}: {result.stderr.strip()}")
+
+
+def _is_contiguous(scene_list: List[Tuple[float, float]], tolerance: float = 1e-3) -> bool:
+    """Return True if scenes start at zero and each begins where the previous ends."""
+    if abs(scene_list[0][0]) > tolerance:
+        return False
+    return all(
+        abs(start - prev_end) <= tolerance
+        for (_, prev_end), (start, _) in zip(scene_list, scene_list[1:])
+    )
+
+
+async def _split_one(
+    src: Path,
+    start: float,
+    end: float,
+    out: Path,
+    codec_args: List[str],
+    semaphore: asyncio.Semaphore
+) -> None:
+    """Cut [start, end) of src into out with one FFmpeg process."""
+    cmd = [
+        "ffmpeg", "-nostdin", "-y", "-v", "error",
+        *_ffmpeg_thread_args(),
+        "-ss", f"{start:.6f}",  # before -i for a fast seek
+        "-i", str(src),
+        "-t", f"{end - start:.6f}",
+        *codec_args,
+        *_ffmpeg_thread_args(),
+        str(out)
+    ]
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+        returncode = await proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with code {returncode} while writing {out.name}")
+
+
+async def _split_all(
+    video_path: Path,
+    scene_list: List[Tuple[float, float]],
+    clip_paths: List[Path],
+    codec_args: List[str]
+) -> None:
+    """
+    Split every scene concurrently.
+    
+    At most os.cpu_count() FFmpegs run at a time, or the worker's share of the
+    CPU inside detect_and_split_many.
+    """
+    semaphore = asyncio.Semaphore(_ffmpeg_max_procs or os.cpu_count() or 1)
+    await asyncio.gather(*[
+        _split_one(video_path, start, end, out, codec_args, semaphore)
+        for (start, end), out in zip(scene_list, clip_paths)
+    ])
+
+
+
+def _run_blocking(coro) -> None:
+    """
+    Run a coroutine to completion and block until it finishes.
+    
+    asyncio.run() refuses to start inside a running event loop, so when the
+    caller already has one the coroutine gets its own loop on a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(coro)
+        return
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(asyncio.run, coro).result()
+
+
+def _probe_fps(video_path: Path) -> float:
+    """Read the frame rate of the first video stream with ffprobe."""
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=r_frame_rate",
+        "-of", "csv=p=0",
+        str(video_path)
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe exited with code {result.returncode}: {result.stderr.strip()}")
+    try:
+        return float(Fraction(result.stdout.strip())) or 30
+    except (ValueError, ZeroDivisionError):
+        return 30
+
+
+def _split_video_reencode(
+    video_path: Path,
+    scene_list: List[Tuple[float, float]],
+    clip_paths: List[Path],
+    fps: float
+) -> None:
+    """Split with one frame-accurate FFmpeg re-encode per scene."""
+    import numpy as np
+    
+    # Snap every boundary to an exact frame time in one vectorised step
+    frame_times = np.rint(np.asarray(scene_list, dtype=np.float64) * fps) / fps
+    _run_blocking(_split_all(video_path, frame_times.tolist(), clip_paths, REENCODE_ARGS))
+
+
 def detect_and_split(video_path: str, **kwargs) -> List[Path]:
     """
     Convenience wrapper: detect scenes then split video into clips.
@@ -176,31 +836,163 @@ def detect_and_split(video_path: str, **kwargs) -> List[Path]:
     adaptive_threshold = kwargs.get('adaptive_threshold', 2.0)
     min_scene_len = kwargs.get('min_scene_len', 15)
     window = kwargs.get('window', 20)
+    backend = kwargs.get('backend', 'ffmpeg')
+    splitter = kwargs.get('splitter')
     output_dir = kwargs.get('output_dir', 'clips')
+    copy = kwargs.get('copy', True)
     
     # Detect scenes
     scenes = detect_scenes(
         video_path,
         adaptive_threshold=adaptive_threshold,
         min_scene_len=min_scene_len,
-        window=window
+        window=window,
+        backend=backend,
+        splitter=splitter
     )
     
     # Split video
-    split_video(video_path, scenes, output_dir)
-    
-    # Return list of created clip files
-    output_path = Path(output_dir)
-    clip_files = sorted(output_path.glob("*.mp4"))
+    clip_files = split_video(video_path, scenes, output_dir, copy=copy, fps=scenes.fps)
     
     logger.info(f"Created {len(clip_files)} clip files")
     return clip_files
 
 
-def create_stats_table(scenes: List[Tuple[float, float]], video_path: str) -> Table:
+class SceneSplitter:
+    """
+    Scene detector/splitter that keeps its frame buffers between videos.
+    
+    The numba backends need an (N, height, width) luma buffer plus per-frame
+    difference, prefix-sum and cut-index arrays. A SceneSplitter owns them and only
+    replaces them when a longer video arrives, so a service processing many
+    videos stops reallocating them per call. Buffers are allocated on the
+    first numba-backend detection, sized for ``max_frames`` frames.
+    
+    A SceneSplitter is not thread-safe; detect_scenes and detect_and_split use
+    one per thread unless given one explicitly. That implicit splitter drops
+    buffers grown past ``max_frames`` after each video, so only an explicit
+    SceneSplitter keeps a long video's buffers for the next call.
+    """
+    
+    def __init__(self, max_frames: int = 100_000, height: int = LUMA_HEIGHT, width: int = LUMA_WIDTH):
+        self.max_frames = max_frames
+        self.height = height
+        self.width = width
+        self.luma: Optional["np.ndarray"] = None
+        self.diffs: Optional["np.ndarray"] = None
+        self.csum: Optional["np.ndarray"] = None
+        self.cuts: Optional["np.ndarray"] = None
+    
+    def detect(self, video_path: str, **kwargs) -> SceneList:
+        """Detect scenes like detect_scenes, reusing this splitter's buffers."""
+        return detect_scenes(video_path, splitter=self, **kwargs)
+    
+    def process(self, video_path: str, **kwargs) -> List[Path]:
+        """Detect scenes and split clips like detect_and_split, reusing this splitter's buffers."""
+        return detect_and_split(video_path, splitter=self, **kwargs)
+    
+    def _luma_buffer(self) -> "np.ndarray":
+        """Return the luma buffer, allocating it on first use."""
+        if self.luma is None:
+            import numpy as np
+            self.luma = np.empty((self.max_frames, self.height, self.width), dtype=np.uint8)
+        return self.luma
+    
+    def _work_buffers(self, n_frames: int) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Return difference, prefix-sum and cut-index views for ``n_frames`` frames."""
+        if self.diffs is None or self.csum is None or self.cuts is None or len(self.diffs) < n_frames:
+            import numpy as np
+            size = max(n_frames, self.max_frames)
+            self.diffs = np.empty(size, dtype=np.float64)
+            self.csum = np.empty(size + 1, dtype=np.float64)
+            self.cuts = np.empty(size, dtype=np.int64)
+        return self.diffs[:n_frames], self.csum[:n_frames + 1], self.cuts[:n_frames]
+    
+    def _drop_oversized_buffers(self) -> None:
+        """Release buffers grown past ``max_frames``; they are reallocated at that size on next use."""
+        if self.luma is not None and len(self.luma) > self.max_frames:
+            self.luma = None
+        if self.diffs is not None and len(self.diffs) > self.max_frames:
+            self.diffs = self.csum = self.cuts = None
+
+
+_local = threading.local()
+
+
+def _local_splitter() -> SceneSplitter:
+    """Return this thread's SceneSplitter, creating it on first use."""
+    splitter = getattr(_local, "splitter", None)
+    if splitter is None:
+        splitter = _local.splitter = SceneSplitter()
+    return splitter
+
+
+def _init_worker(threads: int, max_procs: int) -> None:
+    """
+    Cap FFmpeg/OpenCV threads and concurrent FFmpegs in a detect_and_split_many worker.
+    
+    OpenCV is not imported here; _load_cv2() applies the cap when a backend
+    first needs it, so ffmpeg-backend workers never pay for the import.
+    """
+    global _ffmpeg_threads, _ffmpeg_max_procs
+    _ffmpeg_threads = threads
+    _ffmpeg_max_procs = max_procs
+
+
+def detect_and_split_many(
+    video_paths: List[str],
+    workers: Optional[int] = None,
+    **kwargs
+) -> List[List[Path]]:
+    """
+    Run detect_and_split on several videos in parallel worker processes.
+    
+    Each video's clips go to its own subdirectory of ``output_dir``, named
+    ``<index>_<video stem>`` so videos sharing a file name in different
+    folders cannot overwrite each other's clips. Every worker caps FFmpeg
+    (decoders and encoders) and OpenCV at ``WORKER_THREADS`` threads and runs
+    at most its share of the cores in concurrent per-clip FFmpegs, so the
+    pool does not oversubscribe the CPU.
+    
+    Args:
+        video_paths: Paths to the input video files
+        workers: Number of worker processes (default: os.cpu_count())
+        **kwargs: Additional arguments passed to detect_and_split
+        
+    Returns:
+        List of clip file lists, in the same order as video_paths
+        
+    Raises:
+        FileNotFoundError: If a video file doesn't exist
+        ValueError: If video processing fails
+    """
+    output_dir = Path(kwargs.pop('output_dir', 'clips'))
+    workers = workers or os.cpu_count()
+    
+    logger.info(f"Processing {len(video_paths)} videos with {workers} workers")
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(WORKER_THREADS, max(1, (os.cpu_count() or 1) // (workers * WORKER_THREADS)))
+    ) as executor:
+        futures = [
+            executor.submit(
+                detect_and_split,
+                path,
+                output_dir=output_dir / f"{i:03d}_{Path(path).stem}",
+                **kwargs
+            )
+            for i, path in enumerate(video_paths, 1)
+        ]
+        return [future.result() for future in futures]
+
+
+def create_stats_table(scenes: List[Tuple[float, float]], video_path: str) -> Optional["Table"]:
     """Create a rich table showing scene statistics."""
     if not RICH_AVAILABLE:
         return None
+    from rich.table import Table
     
     table = Table(title=f"Scene Analysis: {Path(video_path).name}")
     table.add_column("Scene", style="cyan", no_wrap=True)
@@ -222,15 +1014,21 @@ def create_stats_table(scenes: List[Tuple[float, float]], video_path: str) -> Ta
 
 def save_stats_csv(scenes: List[Tuple[float, float]], stats_file: str) -> None:
     """Save scene statistics to a CSV file."""
-    import csv
+    import numpy as np
     
-    with open(stats_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['Scene', 'Start_Seconds', 'End_Seconds', 'Duration_Seconds'])
-        
-        for i, (start, end) in enumerate(scenes, 1):
-            duration = end - start
-            writer.writerow([f"Scene_{i:02d}", start, end, duration])
+    bounds = np.asarray(scenes, dtype=np.float64).reshape(-1, 2)
+    starts, ends = bounds[:, 0], bounds[:, 1]
+    rows = np.column_stack([np.arange(1, len(bounds) + 1), starts, ends, ends - starts])
+    
+    # One multi-column format string: NumPy formats each row in a single call
+    np.savetxt(
+        stats_file,
+        rows,
+        fmt="Scene_%02d,%.6f,%.6f,%.6f",
+        header="Scene,Start_Seconds,End_Seconds,Duration_Seconds",
+        comments="",
+        encoding="utf-8"
+    )
     
     logger.info(f"Statistics saved to {stats_file}")
 
@@ -272,7 +1070,14 @@ Examples:
         '-w', '--window',
         type=int,
         default=20,
-        help='Rolling average window size in frames (default: 20)'
+        help='Rolling average window size in frames; ignored by the ffmpeg backend (default: 20)'
+    )
+    
+    parser.add_argument(
+        '-b', '--backend',
+        choices=BACKENDS,
+        default='ffmpeg',
+        help='Scene detection backend (default: ffmpeg)'
     )
     
     parser.add_argument(
@@ -281,6 +1086,12 @@ Examples:
         help='Output directory for clips (default: clips/)'
     )
     
+    parser.add_argument(
+        '--accurate',
+        action='store_true',
+        help='Re-encode clips for frame-accurate cuts (slower than keyframe stream copy)'
+    )
+    
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -315,11 +1126,13 @@ Examples:
             args.input,
             adaptive_threshold=args.threshold,
             min_scene_len=args.min_len,
-            window=args.window
+            window=args.window,
+            backend=args.backend
         )
         
         # Display results
         if RICH_AVAILABLE:
+            from rich.console import Console
             console = Console()
             console.print(f"\n[bold green]✓[/bold green] Detected {len(scenes)} scenes in {Path(args.input).name}")
             
@@ -343,13 +1156,17 @@ Examples:
         
         # Split video unless dry run
         if not args.dry_run:
-            split_video(args.input, scenes, args.output)
+            split_video(args.input, scenes, args.output, copy=not args.accurate, fps=scenes.fps)
             
             if RICH_AVAILABLE:
                 console.print(f"\n[bold green]✓[/bold green] Video split into clips in '{args.output}/'")
         
         return 0
         
+    except ImportError as e:
+        print(f"Missing dependency: {e}")
+        print(f"Install with: {INSTALL_HINT}")
+        return 3
     except (FileNotFoundError, ValueError) as e:
         logger.error(f"Processing error: {e}")
         return 2
@@ -0,0 +1,355 @@
+"""Tests for the scene splitter."""
+
+import asyncio
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# tests/client shadows the top-level client package, so import the module directly
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "client" / "splitter"))
+import splitter  # noqa: E402
+
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not on PATH")
+
+
+def _naive_adaptive_cuts(diffs, window, thresh, min_len):
+    """Reference adaptive rule that re-sums each window directly."""
+    cuts = []
+    last_cut = 0
+    for i in range(window + 1, len(diffs) - window):
+        neighbours = list(diffs[i - window:i]) + list(diffs[i + 1:i + window + 1])
+        average = sum(neighbours) / len(neighbours)
+        ratio = diffs[i] / average if average > 1e-5 else 255.0
+        if ratio >= thresh and diffs[i] >= splitter.MIN_CONTENT_VAL and i - last_cut >= min_len:
+            cuts.append(i)
+            last_cut = i
+    return cuts
+
+
+def _make_video(path: Path, seconds: int, gop: int) -> Path:
+    """Encode a synthetic 30 fps test clip with a keyframe every ``gop`` frames."""
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-y", "-v", "error",
+            "-f", "lavfi", "-i", f"testsrc=duration={seconds}:size=160x90:rate=30",
+            "-c:v", "libx264", "-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0",
+            "-pix_fmt", "yuv420p", str(path)
+        ],
+        check=True
+    )
+    return path
+
+
+def _make_cut_video(path: Path, colors=("black", "white", "black"), seconds: int = 2, extra_args=()) -> Path:
+    """Encode a 30 fps clip of solid-colour scenes, ``seconds`` long each, with hard cuts."""
+    cmd = ["ffmpeg", "-nostdin", "-y", "-v", "error"]
+    for color in colors:
+        cmd += ["-f", "lavfi", "-i", f"color={color}:size=160x90:rate=30:duration={seconds}"]
+    inputs = "".join(f"[{i}]" for i in range(len(colors)))
+    cmd += [
+        "-filter_complex", f"{inputs}concat=n={len(colors)}:v=1",
+        "-c:v", "libx264", "-g", "30", "-pix_fmt", "yuv420p",
+        *extra_args, str(path)
+    ]
+    subprocess.run(cmd, check=True)
+    return path
+
+
+def _frame_count(path: Path) -> int:
+    """Count the frames OpenCV decodes from ``path``."""
+    cv2 = pytest.importorskip("cv2")
+    cap = cv2.VideoCapture(str(path))
+    count = 0
+    while cap.grab():
+        count += 1
+    cap.release()
+    return count
+
+
+@requires_ffmpeg
+def test_split_video_copy_single_scene(tmp_path):
+    video = _make_video(tmp_path / "in.mp4", seconds=6, gop=30)
+
+    clips = splitter.split_video(str(video), [(0.0, 6.0)], tmp_path / "clips")
+
+    assert clips == [tmp_path / "clips" / "scene_001.mp4"]
+    assert sorted(p.name for p in (tmp_path / "clips").iterdir()) == ["scene_001.mp4"]
+
+
+def test_is_contiguous():
+    assert splitter._is_contiguous([(0.0, 1.5), (1.5, 3.0), (3.0, 4.2)])
+    assert splitter._is_contiguous([(0.0004, 1.0), (1.0002, 2.0)])
+    assert not splitter._is_contiguous([(0.0, 1.0), (1.5, 3.0)])
+    assert not splitter._is_contiguous([(2.0, 3.0), (3.0, 4.0)])
+
+
+@requires_ffmpeg
+def test_split_video_copy_non_contiguous(tmp_path):
+    video = _make_video(tmp_path / "in.mp4", seconds=6, gop=30)
+
+    clips = splitter.split_video(str(video), [(0.0, 2.0), (4.0, 6.0)], tmp_path / "clips")
+
+    assert clips == [tmp_path / "clips" / "scene_001.mp4", tmp_path / "clips" / "scene_002.mp4"]
+    assert all(clip.stat().st_size > 0 for clip in clips)
+
+
+@requires_ffmpeg
+def test_split_video_copy_sparse_keyframes(tmp_path):
+    # Keyframes every 3 s: the cuts at 1 s and 2 s collapse into the first clip
+    video = _make_video(tmp_path / "in.mp4", seconds=9, gop=90)
+    scenes = [(0.0, 1.0), (1.0, 2.0), (2.0, 6.0), (6.0, 9.0)]
+
+    clips = splitter.split_video(str(video), scenes, tmp_path / "clips")
+
+    assert 0 < len(clips) < len(scenes)
+    assert all(clip.is_file() for clip in clips)
+    assert sorted(clips) == sorted((tmp_path / "clips").iterdir())
+
+
+def test_save_stats_csv(tmp_path):
+    pytest.importorskip("numpy")
+    stats_file = tmp_path / "stats.csv"
+
+    splitter.save_stats_csv([(0.0, 1.5), (1.5, 4.25)], str(stats_file))
+
+    assert stats_file.read_text(encoding="utf-8").splitlines() == [
+        "Scene,Start_Seconds,End_Seconds,Duration_Seconds",
+        "Scene_01,0.000000,1.500000,1.500000",
+        "Scene_02,1.500000,4.250000,2.750000",
+    ]
+
+
+@pytest.mark.parametrize("window", [1, 2, 5])
+@pytest.mark.parametrize("min_len", [1, 15])
+def test_adaptive_cuts_matches_naive_window(window, min_len):
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(window * 100 + min_len)
+    diffs = rng.uniform(0.0, 5.0, 600)
+    diffs[rng.choice(600, 20, replace=False)] = rng.uniform(20.0, 120.0, 20)
+    diffs[:50] = 0.0
+    csum = np.empty(len(diffs) + 1)
+    cuts = np.empty(len(diffs), dtype=np.int64)
+
+    expected = _naive_adaptive_cuts(diffs, window, 3.0, min_len)
+    assert expected
+    n_cuts = splitter._adaptive_cuts(diffs, csum, cuts, window, 3.0, min_len)
+    assert cuts[:n_cuts].tolist() == expected
+
+    pytest.importorskip("numba")
+    kernel = splitter._adaptive_cuts_kernel()
+    n_cuts = kernel(diffs, csum, cuts, window, 3.0, min_len)
+    assert cuts[:n_cuts].tolist() == expected
+
+
+@requires_ffmpeg
+def test_detect_scenes_ffmpeg_finds_cuts(tmp_path):
+    video = _make_cut_video(tmp_path / "in.mp4")
+
+    scenes = splitter.detect_scenes(str(video))
+
+    assert scenes == pytest.approx([(0.0, 2.0), (2.0, 4.0), (4.0, 6.0)], abs=0.05)
+    assert scenes.fps == pytest.approx(30.0)
+
+
+@requires_ffmpeg
+def test_detect_scenes_ffmpeg_min_scene_len(tmp_path):
+    video = _make_cut_video(tmp_path / "in.mp4")
+
+    # The cut at 2 s is closer than 90 frames to the start; the one at 4 s is not
+    scenes = splitter.detect_scenes(str(video), min_scene_len=90)
+
+    assert scenes == pytest.approx([(0.0, 4.0), (4.0, 6.0)], abs=0.05)
+
+
+@requires_ffmpeg
+def test_detect_scenes_ffmpeg_start_offset_and_latin1_tag(tmp_path):
+    # MKV counts the 1.4 s start offset in its Duration; the title is not UTF-8
+    video = _make_cut_video(
+        tmp_path / "in.mkv",
+        extra_args=["-output_ts_offset", "1.4", "-metadata", b"title=caf\xe9"]
+    )
+
+    scenes = splitter.detect_scenes(str(video))
+
+    assert scenes == pytest.approx([(0.0, 2.0), (2.0, 4.0), (4.0, 6.0)], abs=0.05)
+
+
+@requires_ffmpeg
+def test_split_video_reencode_is_frame_accurate(tmp_path):
+    video = _make_video(tmp_path / "in.mp4", seconds=6, gop=90)
+    scenes = [(0.0, 1.0), (1.0, 2.5), (2.5, 6.0)]
+
+    clips = splitter.split_video(str(video), scenes, tmp_path / "clips", copy=False, fps=30)
+
+    assert [clip.name for clip in clips] == ["scene_001.mp4", "scene_002.mp4", "scene_003.mp4"]
+    assert [_frame_count(clip) for clip in clips] == [30, 45, 105]
+
+
+@requires_ffmpeg
+def test_split_video_inside_running_event_loop(tmp_path):
+    video = _make_video(tmp_path / "in.mp4", seconds=4, gop=30)
+
+    async def split():
+        return splitter.split_video(
+            str(video), [(0.0, 2.0), (2.0, 4.0)], tmp_path / "clips", copy=False, fps=30
+        )
+
+    clips = asyncio.run(split())
+
+    assert all(clip.is_file() for clip in clips)
+    assert len(clips) == 2
+
+
+@requires_ffmpeg
+def test_detect_and_split_many_unique_output_dirs(tmp_path):
+    # Same file name in two folders must not share an output directory
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    first = _make_cut_video(tmp_path / "a" / "clip.mp4")
+    second = _make_cut_video(tmp_path / "b" / "clip.mp4", colors=("white", "black"))
+    output_dir = tmp_path / "clips"
+
+    results = splitter.detect_and_split_many([str(first), str(second)], workers=2, output_dir=output_dir)
+
+    assert [[clip.relative_to(output_dir).as_posix() for clip in clips] for clips in results] == [
+        ["001_clip/scene_001.mp4", "001_clip/scene_002.mp4", "001_clip/scene_003.mp4"],
+        ["002_clip/scene_001.mp4", "002_clip/scene_002.mp4"],
+    ]
+    assert all(clip.is_file() for clips in results for clip in clips)
+
+
+@requires_ffmpeg
+def test_scene_splitter_keeps_buffers_between_videos(tmp_path):
+    pytest.importorskip("numba")
+    video = _make_cut_video(tmp_path / "in.mp4")
+    scene_splitter = splitter.SceneSplitter(max_frames=100)
+
+    first = scene_splitter.detect(str(video), backend="numba")
+    luma, diffs = scene_splitter.luma, scene_splitter.diffs
+    second = scene_splitter.detect(str(video), backend="numba")
+
+    # The 180-frame video outgrew max_frames; an explicit splitter keeps the grown buffers
+    assert len(luma) >= 180
+    assert scene_splitter.luma is luma
+    assert scene_splitter.diffs is diffs
+    assert first == second == pytest.approx([(0.0, 2.0), (2.0, 4.0), (4.0, 6.0)])
+
+
+@requires_ffmpeg
+def test_implicit_splitter_drops_oversized_buffers(tmp_path, monkeypatch):
+    pytest.importorskip("numba")
+    video = _make_cut_video(tmp_path / "in.mp4")
+    implicit = splitter.SceneSplitter(max_frames=100)
+    monkeypatch.setattr(splitter, "_local_splitter", lambda: implicit)
+
+    # The 180-frame video needs buffers larger than max_frames
+    scenes = splitter.detect_scenes(str(video), backend="numba")
+
+    assert scenes == pytest.approx([(0.0, 2.0), (2.0, 4.0), (4.0, 6.0)])
+    assert implicit.luma is None
+    assert implicit.diffs is None
+
+
+@requires_ffmpeg
+def test_detect_scenes_numba(tmp_path):
+    pytest.importorskip("numba")
+    video = _make_cut_video(tmp_path / "in.mp4")
+
+    scenes = splitter.detect_scenes(str(video), backend="numba")
+    merged = splitter.detect_scenes(str(video), backend="numba", min_scene_len=90)
+
+    assert scenes == pytest.approx([(0.0, 2.0), (2.0, 4.0), (4.0, 6.0)])
+    assert scenes.fps == pytest.approx(30.0)
+    assert merged == pytest.approx([(0.0, 4.0), (4.0, 6.0)])
+
+
+@requires_ffmpeg
+@pytest.mark.parametrize("rows", [200, 10])
+def test_decode_luma_fills_contiguous_buffer(tmp_path, rows):
+    cv2 = pytest.importorskip("cv2")
+    np = pytest.importorskip("numpy")
+    video = _make_cut_video(tmp_path / "in.mp4")
+    luma = np.empty((rows, splitter.LUMA_HEIGHT, splitter.LUMA_WIDTH), dtype=np.uint8)
+
+    cap = cv2.VideoCapture(str(video))
+    try:
+        decoded, n_frames = splitter._decode_luma(cap, luma)
+    finally:
+        cap.release()
+
+    assert n_frames == 180
+    assert (decoded is luma) == (rows >= n_frames)
+    assert decoded.flags.c_contiguous
+    assert decoded[:60].max() < 40
+    assert decoded[60:120].min() > 200
+    assert decoded[120:180].max() < 40
+
+
+@requires_ffmpeg
+def test_detect_scenes_pyav_hw(tmp_path):
+    pytest.importorskip("numba")
+    pytest.importorskip("av")
+    # MKV leaves PyAV's frame count at zero, so the 10-frame buffer grows while
+    # decoding; the Latin-1 title must not fail the open
+    video = _make_cut_video(tmp_path / "in.mkv", extra_args=["-metadata", b"title=caf\xe9"])
+
+    scenes = splitter.detect_scenes(
+        str(video), backend="pyav_hw", splitter=splitter.SceneSplitter(max_frames=10)
+    )
+
+    assert scenes == pytest.approx([(0.0, 2.0), (2.0, 4.0), (4.0, 6.0)])
+    assert scenes.fps == pytest.approx(30.0)
+
+
+@requires_ffmpeg
+def test_read_frames_threaded_matches_sequential(tmp_path):
+    cv2 = pytest.importorskip("cv2")
+    np = pytest.importorskip("numpy")
+    video = _make_video(tmp_path / "in.mp4", seconds=2, gop=30)
+
+    def read(reader):
+        cap = cv2.VideoCapture(str(video))
+        try:
+            # Slots are reused, so copy each frame before resuming the reader
+            return [frame.copy() for frame in reader(cap, 160, 90)]
+        finally:
+            cap.release()
+
+    sequential = read(splitter._read_frames)
+    threaded = read(splitter._read_frames_threaded)
+
+    assert len(threaded) == len(sequential) == 60
+    assert all(np.array_equal(a, b) for a, b in zip(threaded, sequential))
+
+
+@requires_ffmpeg
+def test_read_frames_threaded_stops_early(tmp_path):
+    cv2 = pytest.importorskip("cv2")
+    video = _make_video(tmp_path / "in.mp4", seconds=2, gop=30)
+    cap = cv2.VideoCapture(str(video))
+
+    frames = splitter._read_frames_threaded(cap, 160, 90)
+    next(frames)
+    # Closing the generator must release the reader thread rather than hang
+    frames.close()
+    cap.release()
+
+
+@requires_ffmpeg
+@pytest.mark.filterwarnings("ignore:get_seconds:DeprecationWarning")
+@pytest.mark.parametrize("colors", [("black", "white", "black"), ("black",)])
+def test_detect_scenes_pyscenedetect_matches_detect(tmp_path, colors):
+    scenedetect = pytest.importorskip("scenedetect")
+    video = _make_cut_video(tmp_path / "in.mp4", colors=colors)
+
+    expected = scenedetect.detect(
+        str(video),
+        scenedetect.AdaptiveDetector(adaptive_threshold=2.0, min_scene_len=15, window_width=20)
+    )
+    scenes = splitter.detect_scenes(str(video), backend="pyscenedetect")
+
+    assert scenes == pytest.approx([(start.get_seconds(), end.get_seconds()) for start, end in expected])